@@ -0,0 +1,58 @@
+/* Optional C implementation of the type check used by drastic.
+ *
+ * drastic/drastic.py falls back to a pure Python version when this
+ * extension is not built. */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+/* type_ok(value, types, nullable) -> bool
+ *
+ * Returns True if value is an instance of one of types, or if nullable is
+ * true and value is None. */
+static PyObject *
+type_ok(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    int nullable, r;
+
+    if (nargs != 3) {
+        PyErr_Format(PyExc_TypeError,
+                     "type_ok() takes exactly 3 arguments (%zd given)", nargs);
+        return NULL;
+    }
+    if (args[0] == Py_None) {
+        nullable = PyObject_IsTrue(args[2]);
+        if (nullable < 0)
+            return NULL;
+        if (nullable)
+            Py_RETURN_TRUE;
+    }
+    r = PyObject_IsInstance(args[0], args[1]);
+    if (r < 0)
+        return NULL;
+    if (r)
+        Py_RETURN_TRUE;
+    Py_RETURN_FALSE;
+}
+
+static PyMethodDef drastic_fast_methods[] = {
+    {"type_ok", (PyCFunction)(void (*)(void))type_ok, METH_FASTCALL,
+     "type_ok(value, types, nullable) -> bool\n\n"
+     "Returns True if value is an instance of one of types, or if nullable\n"
+     "is true and value is None."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef drastic_fast_module = {
+    PyModuleDef_HEAD_INIT,
+    "_drastic_fast",
+    "C implementation of the drastic type check.",
+    -1,
+    drastic_fast_methods
+};
+
+PyMODINIT_FUNC
+PyInit__drastic_fast(void)
+{
+    return PyModule_Create(&drastic_fast_module);
+}
@@ -1,5 +1,6 @@
+import functools
 import inspect
-from collections import defaultdict
+import operator
 
 
 #######################
@@ -8,24 +9,30 @@ from collections import defaultdict
 
 nonable = 'nonable'
 
+# Bits of the @init keywords, combined into a mask for each argument
+_NONABLE, _LOCAL, _PRIVATE, _BOOLEAN, _NUMBER, _STRING, _CONTAINER, _COMPARE = (1 << i for i in range(8))
+_KEYWORD_BITS = {
+    'nonable': _NONABLE, 'local': _LOCAL, 'private': _PRIVATE, 'boolean': _BOOLEAN,
+    'number': _NUMBER, 'string': _STRING, 'container': _CONTAINER, 'compare': _COMPARE}
+
 
 #######################
 # Disable/Enable
 #######################
 
-_enabled = True
+# Mutable cell shared by all wrappers, which read it through a closure
+# variable instead of looking up a module global on every call
+_enabled = [True]
 
 def disable():
     """ Disable all drastic behaviours. """
 
-    global _enabled
-    _enabled = False
+    _enabled[0] = False
 
 def enable():
     """ Enable all drastic behaviours. """
 
-    global _enabled
-    _enabled = True
+    _enabled[0] = True
     
 
 #######################
@@ -37,11 +44,10 @@ class ReturnTypeError(TypeError):
 
     def __init__(self,
         func_name: "name of the function",
-        expected: "expected types or 'nonable' keyword",
+        expected_types: "names of the expected types, as returned by _type_names",
         returned: "returned value"):
         """ Initialize the exception. """
-        
-        expected_types = "', '".join(t.__name__ for t in expected if isinstance(t, type))
+
         error = "Return type of function '{0}' is incorrect: "
         error += "expected '{1}' but '{2}' returned."
         error = error.format(func_name, expected_types, returned.__name__)
@@ -54,11 +60,10 @@ class ArgumentTypeError(TypeError):
     def __init__(self,
         func_name: "name of the function",
         arg_name: "name of the argument",
-        expected: "expected types or 'nonable' keyword",
+        expected_types: "names of the expected types, as returned by _type_names",
         received: "value of the argument"):
         """ Initialize the exception. """
 
-        expected_types = "', '".join(t.__name__ for t in expected if isinstance(t, type))
         error = "Argument '{0}' of function '{1}' is incorrect: "
         error += "excepted '{2}' but '{3}' received."
         error = error.format(arg_name, func_name, expected_types, received.__name__)
@@ -73,14 +78,43 @@ class AnnotationError(Exception):
 # Utils
 #######################
 
-def _type_ok(
+def _py_type_ok(
     value: "value to check",
+    types: "tuple of expected types",
+    nullable: "whether None is allowed"):
+    """ Returns True if value is one of the types or an allowed None. """
+
+    return (nullable and value is None) or isinstance(value, types)
+
+
+try:
+    from ._drastic_fast import type_ok as _type_ok
+except ImportError:
+    _type_ok = _py_type_ok
+
+
+def _compile_expected(
     expected: "expected types or 'nonable' keyword"):
-    """ Returns True if type of value is one of expected. """
+    """ Returns the tuple of expected types, the single expected type if
+    there is only one and whether None is allowed. """
 
+    expected = _to_tuple(expected)
     types = tuple(t for t in expected if isinstance(t, type))
-    nullable = 'nonable' in expected
-    return isinstance(value, types) or (nullable and value is None)
+    return types, _exact_type(types), 'nonable' in expected
+
+
+def _exact_type(
+    types: "tuple of expected types"):
+    """ Returns the type to compare by identity before calling isinstance. """
+
+    return types[0] if len(types) == 1 else None
+
+
+def _type_names(
+    types: "tuple of expected types"):
+    """ Returns the names of the types as displayed in error messages. """
+
+    return "', '".join(t.__name__ for t in types)
 
 
 def _to_tuple(
@@ -90,6 +124,41 @@ def _to_tuple(
     return value if isinstance(value, tuple) else (value,)
 
 
+def _get_spec(
+    func: "function to introspect"):
+    """ Returns the positional argument names, the defaults and the annotations of func. """
+
+    # Look through drastic wrappers, whose own signature is (*args, **kwargs)
+    while (getattr(func, '__drastic_strict__', None) is func
+           or getattr(func, '__drastic_init__', None) is func):
+        func = func.__wrapped__
+
+    code = getattr(func, '__code__', None)
+    if code is None:
+        spec = inspect.getfullargspec(func)
+        return tuple(spec.args), spec.defaults or (), spec.annotations
+    return code.co_varnames[:code.co_argcount], func.__defaults__ or (), func.__annotations__ or {}
+
+
+def _keyword_names(
+    mask: "mask of keyword bits"):
+    """ Returns the names of the keywords in the mask. """
+
+    return [keyword for keyword, bit in _KEYWORD_BITS.items() if mask & bit]
+
+
+def _dict_assignable(
+    obj: "initialized object",
+    fields: "names of the fields to assign"):
+    """ Returns True if updating the __dict__ of obj is equivalent to setting the fields one by one. """
+
+    cls = type(obj)
+    if not hasattr(obj, '__dict__') or cls.__setattr__ is not object.__setattr__:
+        return False
+    return not any(hasattr(type(vars(base)[field]), '__set__')
+                   for base in cls.__mro__ for field in fields if field in vars(base))
+
+
 #######################
 # @init decorator
 #######################
@@ -98,35 +167,54 @@ def strict(
     func: "the function to check"):
     """ Decorator to check arguments and return types. """
 
+    # The marker refers to the wrapper itself, so that a function copying it
+    # through functools.wraps is not mistaken for an already wrapped one
+    if getattr(func, '__drastic_strict__', None) is func:
+        return func
+
+    funcname = func.__name__
+    arg_names, _, annotations = _get_spec(func)
+    skip_self = arg_names[:1] == ('self',)
+
+    # (index, name, types, exact, nullable, type names) of each annotated positional argument
+    per_arg = []
+    for index, name in enumerate(arg_names):
+        if index >= skip_self and name in annotations:
+            types, exact, nullable = _compile_expected(annotations[name])
+            per_arg.append((index, name, types, exact, nullable, _type_names(types)))
+    return_types, return_exact, return_nullable = _compile_expected(annotations.get('return'))
+    return_names = _type_names(return_types)
+    check_return = 'return' in annotations
+    enabled = _enabled
+
+    @functools.wraps(func)
     def checker(
         *args: "arguments of the function",
         **kwargs: "dict of arguments"):
         """ Function checking arguments and return types. """
 
-        if not _enabled:
+        if not enabled[0]:
             return func(*args, **kwargs)
-            
-        funcname = func.__name__
-        spec = inspect.getfullargspec(func)
 
         # Arguments check
-        if args and not spec.args == ['self']:
-            i = 1 if spec.args[0] == 'self' else 0
-            for name, value in zip(spec.args[i:], args[i:]):
-                if name in spec.annotations:
-                    expected = _to_tuple(spec.annotations[name])
-                    if not _type_ok(value, expected):
-                        raise ArgumentTypeError(funcname, name, expected, type(value))
+        if per_arg:
+            nargs = len(args)
+            for index, name, types, exact, nullable, names in per_arg:
+                if index >= nargs:
+                    break
+                value = args[index]
+                if not (type(value) is exact or _type_ok(value, types, nullable)):
+                    raise ArgumentTypeError(funcname, name, names, type(value))
 
         result = func(*args, **kwargs)
 
         # Return check
-        if 'return' in spec.annotations:
-            expected = _to_tuple(spec.annotations['return'])
-            if not _type_ok(result, expected):
-                raise ReturnTypeError(funcname, expected, type(result))
+        if check_return:
+            if not (type(result) is return_exact or _type_ok(result, return_types, return_nullable)):
+                raise ReturnTypeError(funcname, return_names, type(result))
 
         return result
+    checker.__drastic_strict__ = checker
     return checker
 
 #######################
@@ -134,61 +222,77 @@ def strict(
 #######################
 
 # Method to add to the class when 'boolean' in keywords
-def _bool(self):
-    return bool(getattr(self, type(self)._varbool))
+def _make_bool(field):
+    value = operator.attrgetter(field)
+    def _bool(self):
+        return bool(value(self))
+    return _bool
 
 # Methods to add to the class when 'number' in keywords
-def _int(self):
-    return int(getattr(self, type(self)._varnumber))
-def _float(self):
-    return float(getattr(self, type(self)._varnumber))
+def _make_number_methods(field):
+    value = operator.attrgetter(field)
+    def _int(self):
+        return int(value(self))
+    def _float(self):
+        return float(value(self))
+    return _int, _float
 
 # Method to add to the class when 'string' in keywords
-def _str(self):
-    obj_name = type(self).__name__
-    values = ('{0}={1}'.format(field, getattr(self, field)) for field in type(self)._varstr)
-    return '<{0}: {1}>'.format(obj_name, ', '.join(values))
+def _make_str(fields):
+    fields = tuple(fields)
+    values = ('{0}={{{1}}}'.format(field, i) for i, field in enumerate(fields, 1))
+    template = '<{{0}}: {0}>'.format(', '.join(values))
+    getter = operator.attrgetter(*fields)
+    if len(fields) == 1:
+        def _str(self):
+            return template.format(type(self).__name__, getter(self))
+    else:
+        def _str(self):
+            return template.format(type(self).__name__, *getter(self))
+    return _str
 
 # Methods to add to the class when 'container' in keywords
-def _len(self):
-    return len(getattr(self, type(self)._varitems))
-def _getitem(self, key):
-    return getattr(self, type(self)._varitems)[key]
-def _setitem(self, key, value):
-    getattr(self, type(self)._varitems)[key] = value
-def _delitem(self, key):
-    del getattr(self, type(self)._varitems)[key]
-def _iter(self):
-    return iter(getattr(self, type(self)._varitems))
-def _reversed(self):
-    return reversed(getattr(self, type(self)._varitems))
-def _contains(self, item):
-    return item in getattr(self, type(self)._varitems)
+def _make_container_methods(field):
+    items = operator.attrgetter(field)
+    def _getitem(self, key):
+        return items(self)[key]
+    def _setitem(self, key, value):
+        items(self)[key] = value
+    def _delitem(self, key):
+        del items(self)[key]
+    def _iter(self):
+        return iter(items(self))
+    def _reversed(self):
+        return reversed(items(self))
+    def _contains(self, item):
+        return item in items(self)
+    return _getitem, _setitem, _delitem, _iter, _reversed, _contains
 
 # Methods to add to the class when 'compare' in keywords
-def _eq(self, other):
-    varcmp = type(self)._varcmp
-    return getattr(self, varcmp) == getattr(other, varcmp)
-def _ne(self, other):
-    varcmp = type(self)._varcmp
-    return getattr(self, varcmp) != getattr(other, varcmp)
-def _lt(self, other):
-    varcmp = type(self)._varcmp
-    return getattr(self, varcmp) < getattr(other, varcmp)
-def _le(self, other):
-    varcmp = type(self)._varcmp
-    return getattr(self, varcmp) <= getattr(other, varcmp)
+def _make_comparison_methods(field):
+    value = operator.attrgetter(field)
+    def _eq(self, other):
+        return value(self) == value(other)
+    def _ne(self, other):
+        return value(self) != value(other)
+    def _lt(self, other):
+        return value(self) < value(other)
+    def _le(self, other):
+        return value(self) <= value(other)
+    return _eq, _ne, _lt, _le
 
 
 class Object:
     """ Wraps the object to initialize. """
 
+    __slots__ = ('obj', 'type', 'name', 'keywords')
+
     # All existing keywords
     all_keywords = ('nonable', 'local', 'private', 'boolean', 'number', 'string', 'container', 'compare')
     
     # Keywords incompatible with the 'local' keyword
-    local_incompatible = ('private', 'boolean', 'number', 'string', 'container', 'compare')
-    uniques = ('boolean', 'number', 'container', 'compare')
+    local_incompatible = _PRIVATE | _BOOLEAN | _NUMBER | _STRING | _CONTAINER | _COMPARE
+    uniques = _BOOLEAN | _NUMBER | _CONTAINER | _COMPARE
     
     def __init__(self,
         obj: "object to initialize"):
@@ -197,27 +301,19 @@ class Object:
         self.obj = obj
         self.type = type(obj)
         self.name = type(obj).__name__
-        self.keywords = set()
+        self.keywords = 0
 
 
     def add_argument(self,
         argument: "argument to add"):
         """ Adds an argument to the object and the methods that use this argument. """
 
-        self.check_consistency(argument)
         if not hasattr(self.type, '_initialized'):
-            if 'private' in argument.keywords:
-                self.set_private(argument)
-            if 'boolean' in argument.keywords:
-                self.add_tobool(argument)
-            if 'number' in argument.keywords:
-                self.add_tonumber(argument)
-            if 'string' in argument.keywords:
-                self.register_tostring(argument)
-            if 'container' in argument.keywords:
-                self.add_container_methods(argument)
-            if 'compare' in argument.keywords:
-                self.add_comparison_methods(argument)
+            self.check_consistency(argument)
+            keywords = argument.keywords
+            for bit, handler in Object.handlers:
+                if keywords & bit:
+                    handler(self, argument)
             
         setattr(self.obj, argument.name, argument.value)
 
@@ -233,17 +329,16 @@ class Object:
         argument: "we check the consistency between the keywords of this argument and the others"):
         """ Check the consistency of keywords. """
 
-        if 'local' in argument.keywords:
-            incompatibles = [k for k in argument.keywords if k in Object.local_incompatible]
+        if argument.keywords & _LOCAL:
+            incompatibles = argument.keywords & Object.local_incompatible
             if incompatibles:
-                error = "'local' is incompatible with '{0}'.".format("', '".join(incompatibles))
+                error = "'local' is incompatible with '{0}'.".format("', '".join(_keyword_names(incompatibles)))
                 raise AnnotationError(error)
-        uniques = argument.keywords.intersection(Object.uniques)
-        error_keywords = uniques.intersection(self.keywords)
+        error_keywords = argument.keywords & Object.uniques & self.keywords
         if error_keywords:
-            error = "'{0}' should be used once.".format("', '".join(error_keywords))
+            error = "'{0}' should be used once.".format("', '".join(_keyword_names(error_keywords)))
             raise AnnotationError(error)
-        self.keywords.update(argument.keywords)
+        self.keywords |= argument.keywords
 
 
     def set_private(self,
@@ -257,17 +352,16 @@ class Object:
         argument: "bool() will use this argument"):
         """ Adds the method to cast the object to boolean. """
 
-        self.type.__bool__ = _bool
-        self.type._varbool = argument.name
+        self.type.__bool__ = _make_bool(argument.name)
 
 
     def add_tonumber(self,
         argument: "int() and float() will use this argument"):
         """ Adds the methods to cast the object to number. """
 
-        self.type.__int__ = _int
-        self.type.__float__ = _float
-        self.type._varnumber = argument.name
+        int_, float_ = _make_number_methods(argument.name)
+        self.type.__int__ = int_
+        self.type.__float__ = float_
     
 
     def register_tostring(self,
@@ -284,36 +378,49 @@ class Object:
         argument: "container methods will use this collection"):
         """ Adds the methods to emulate a container. """
 
-        self.type.__getitem__ = _getitem
-        self.type.__setitem__ = _setitem
-        self.type.__delitem__ = _delitem
-        self.type.__iter__ = _iter
-        self.type.__reversed__ =  _reversed
-        self.type.__contains__ = _contains
-        self.type._varitems = argument.name
+        getitem, setitem, delitem, iter_, reversed_, contains = _make_container_methods(argument.name)
+        self.type.__getitem__ = getitem
+        self.type.__setitem__ = setitem
+        self.type.__delitem__ = delitem
+        self.type.__iter__ = iter_
+        self.type.__reversed__ = reversed_
+        self.type.__contains__ = contains
 
 
     def add_comparison_methods(self,
         argument: "comparison methods will use this argument"):
         """ Adds the methods for comparison. """
 
-        self.type.__eq__ = _eq
-        self.type.__ne__ = _ne
-        self.type.__lt__ = _lt
-        self.type.__le__ = _le
-        self.type._varcmp = argument.name
+        eq, ne, lt, le = _make_comparison_methods(argument.name)
+        self.type.__eq__ = eq
+        self.type.__ne__ = ne
+        self.type.__lt__ = lt
+        self.type.__le__ = le
 
 
     def add_tostring(self):
         """ Adds the method to cast the object to string representation. """
 
         if hasattr(self.type, '_varstr'):
-            self.type.__str__ = _str
+            self.type.__str__ = _make_str(self.type._varstr)
+
+
+    # Method handling each keyword, in application order ('private' renames
+    # the argument before the others register it)
+    handlers = (
+        (_PRIVATE, set_private),
+        (_BOOLEAN, add_tobool),
+        (_NUMBER, add_tonumber),
+        (_STRING, register_tostring),
+        (_CONTAINER, add_container_methods),
+        (_COMPARE, add_comparison_methods))
 
 
 class Argument():
     """ Represents an argument of the constructor. """
 
+    __slots__ = ('name', 'value', 'types', 'keywords', 'exact', 'nullable')
+
     def __init__(self,
         name: "name of the argument",
         value: "value of the argument",
@@ -321,14 +428,20 @@ class Argument():
         """ Constructor. """
 
         self.name, self.value = name, value
-        self.types, self.keywords = tuple(), set()
-        annotations = _to_tuple(annotations)
-        for annotation in annotations:
+        if annotations is None:
+            self.types, self.keywords, self.exact, self.nullable = tuple(), 0, None, False
+            return
+        self.types, self.keywords = tuple(), 0
+        for annotation in _to_tuple(annotations):
             if isinstance(annotation, type):
                 self.types += (annotation,)
             elif isinstance(annotation, str):
-                self.keywords = set(annotation.split())
-        
+                self.keywords = 0
+                for keyword in annotation.split():
+                    self.keywords |= _KEYWORD_BITS.get(keyword, 0)
+        self.exact = _exact_type(self.types)
+        self.nullable = bool(self.keywords & _NONABLE)
+
         self.check_type()
 
 
@@ -336,33 +449,67 @@ class Argument():
         """ Compare the type of the argument with the expected. """
 
         if self.types:
-            nullable = self.value is None and 'nonable' in self.keywords
-            if not (nullable or isinstance(self.value, self.types)):
-                raise ArgumentTypeError('__init__', self.name, self.types, type(self.value))
+            if not (type(self.value) is self.exact or _type_ok(self.value, self.types, self.nullable)):
+                raise ArgumentTypeError('__init__', self.name, _type_names(self.types), type(self.value))
+
 
+# Each initialized class stores, in its own _layouts attribute and for each
+# @init constructor, the (name, field, types, exact, nullable) of the
+# arguments, the field names and whether they can be assigned through the
+# instance __dict__. Keeping it on the class lets the class be collected.
+_NO_LAYOUTS = {}
 
 def init(
     constructor: "constructor of the object"):
     """ Decorator for object auto-initialization. """
 
+    # The marker refers to the wrapper itself, so that a function copying it
+    # through functools.wraps is not mistaken for an already wrapped one
+    if getattr(constructor, '__drastic_init__', None) is constructor:
+        return constructor
+
+    spec_args, spec_defaults, annotations = _get_spec(constructor)
+    args_tail = spec_args[1:]
+    annot_list = [annotations.get(name) for name in args_tail]
+    enabled = _enabled
+
+    @functools.wraps(constructor)
     def __init(
         *args: "arguments to convert to fields",
         **kwargs: "dict of arguments"):
         """ Initializes the object. """
 
-        if _enabled:
-        
-            spec = inspect.getfullargspec(constructor)
-            arguments = list(args)
-            if len(arguments) < len(spec.args):
-                arguments += spec.defaults[len(arguments) - len(spec.args):]
-
-            annotations = defaultdict(lambda: None, spec.annotations)
-            
-            obj = Object(arguments[0])
-            for name, value in zip(spec.args[1:], arguments[1:]):
-                obj.add_argument(Argument(name, value, annotations[name]))
-            obj.finalize()
+        if enabled[0]:
+
+            arguments = args
+            if len(arguments) < len(spec_args):
+                arguments += spec_defaults[len(arguments) - len(spec_args):]
+
+            layout = type(arguments[0]).__dict__.get('_layouts', _NO_LAYOUTS).get(constructor)
+            if layout is None:
+                obj = Object(arguments[0])
+                vector = []
+                for name, value, annotations in zip(args_tail, arguments[1:], annot_list):
+                    argument = Argument(name, value, annotations)
+                    obj.add_argument(argument)
+                    vector.append((name, argument.name, argument.types, argument.exact, argument.nullable))
+                obj.finalize()
+                fields = tuple(field for _, field, _, _, _ in vector)
+                if '_layouts' not in obj.type.__dict__:
+                    obj.type._layouts = {}
+                obj.type._layouts[constructor] = (vector, fields, _dict_assignable(obj.obj, fields))
+            else:
+                obj = arguments[0]
+                vector, fields, use_dict = layout
+                for (name, _, types, exact, nullable), value in zip(vector, arguments[1:]):
+                    if types and not (type(value) is exact or _type_ok(value, types, nullable)):
+                        raise ArgumentTypeError('__init__', name, _type_names(types), type(value))
+                if use_dict:
+                    obj.__dict__.update(zip(fields, arguments[1:]))
+                else:
+                    for field, value in zip(fields, arguments[1:]):
+                        setattr(obj, field, value)
 
         return constructor(*args, **kwargs)
+    __init.__drastic_init__ = __init
     return __init
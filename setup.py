@@ -1,7 +1,30 @@
-from distutils.core import setup
+from setuptools import Extension, setup
+
+# drastic.py stays plain Python: Cython compiles it when it and a C compiler
+# are available, and the source module is used as is otherwise.
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        ['drastic/drastic.py'],
+        language_level=3,
+        compiler_directives={
+            'boundscheck': False,
+            'wraparound': False,
+            'annotation_typing': False,
+        })
+    # Fall back to the pure Python module when the C code cannot be compiled
+    for ext in ext_modules:
+        ext.optional = True
+except ImportError:
+    ext_modules = []
+
+# C implementation of the type check, skipped if it cannot be compiled
+ext_modules.append(Extension('drastic._drastic_fast', ['drastic/_drastic_fast.c'], optional=True))
+
 setup(
   name = 'drastic',
   packages = ['drastic'],
+  ext_modules = ext_modules,
   version = '1.2',
   description = 'Reduce the size of your Python code and increase its robustness.',
   author = 'Clement Michard',
@@ -0,0 +1,238 @@
+import functools
+import gc
+import inspect
+import unittest
+import weakref
+
+from drastic import init, strict
+from drastic.drastic import AnnotationError, ArgumentTypeError, _py_type_ok, _type_ok
+
+try:
+    from drastic._drastic_fast import type_ok as _c_type_ok
+except ImportError:
+    _c_type_ok = None
+
+
+class InitTest(unittest.TestCase):
+    """ Tests of the @init decorator across several instances. """
+
+    def test_private_on_every_instance(self):
+        class User:
+            @init
+            def __init__(self, name: (str, 'private string')):
+                pass
+
+        for name in ('first', 'second'):
+            user = User(name)
+            self.assertEqual(user._User__name, name)
+            self.assertFalse(hasattr(user, 'name'))
+            self.assertEqual(str(user), '<User: _User__name={0}>'.format(name))
+
+    def test_type_check_after_first_instance(self):
+        class Point:
+            @init
+            def __init__(self, x: int, y: (int, 'nonable')=None):
+                pass
+
+        Point(1)
+        self.assertEqual(Point(2, None).y, None)
+        self.assertRaises(ArgumentTypeError, Point, 'x')
+        self.assertRaises(ArgumentTypeError, Point, 1, 'y')
+
+    def test_runtime_subclass_is_collected(self):
+        class Base:
+            @init
+            def __init__(self, x: int):
+                pass
+
+        subclass = type('Sub', (Base,), {})
+        subclass(1)
+        subclass(2)
+        ref = weakref.ref(subclass)
+        del subclass
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_property_setter_after_first_instance(self):
+        class Temperature:
+            @init
+            def __init__(self, degrees: int):
+                pass
+
+            @property
+            def degrees(self):
+                return self._degrees
+
+            @degrees.setter
+            def degrees(self, value):
+                self._degrees = value * 10
+
+        for degrees in (1, 2):
+            temperature = Temperature(degrees)
+            self.assertEqual(temperature.degrees, degrees * 10)
+            self.assertNotIn('degrees', vars(temperature))
+
+    def test_slots_after_first_instance(self):
+        class Point:
+            __slots__ = ('x', 'y')
+
+            @init
+            def __init__(self, x: int, y: int=0):
+                pass
+
+        for x in (1, 2):
+            point = Point(x, x + 1)
+            self.assertEqual((point.x, point.y), (x, x + 1))
+
+    def test_plain_class_after_first_instance(self):
+        class Point:
+            @init
+            def __init__(self, x: int, y: int=0):
+                pass
+
+        for x in (1, 2):
+            self.assertEqual(vars(Point(x)), {'x': x, 'y': 0})
+
+
+class KeywordsTest(unittest.TestCase):
+    """ Tests of the @init keyword validation. """
+
+    def test_local_incompatible(self):
+        class Point:
+            @init
+            def __init__(self, x: 'local private string'):
+                pass
+
+        with self.assertRaises(AnnotationError) as context:
+            Point(1)
+        self.assertEqual(str(context.exception), "'local' is incompatible with 'private', 'string'.")
+
+    def test_unique_keyword_used_twice(self):
+        class Flags:
+            @init
+            def __init__(self, a: 'boolean', b: 'boolean'):
+                pass
+
+        with self.assertRaises(AnnotationError) as context:
+            Flags(1, 2)
+        self.assertEqual(str(context.exception), "'boolean' should be used once.")
+
+    def test_unknown_keyword_ignored(self):
+        class Point:
+            @init
+            def __init__(self, x: (int, 'string unknown')):
+                pass
+
+        point = Point(1)
+        self.assertEqual(point.x, 1)
+        self.assertEqual(str(point), '<Point: x=1>')
+
+
+class TypeOkTest(unittest.TestCase):
+    """ Tests of the type check, in Python and in C when it is built. """
+
+    # (value, types, nullable, expected result)
+    cases = (
+        (1, (int,), False, True),
+        (True, (int,), False, True),
+        ('a', (int, str), False, True),
+        (None, (int,), True, True),
+        (None, (int,), False, False),
+        (1.5, (int, str), False, False),
+    )
+
+    def check(self, type_ok):
+        for value, types, nullable, expected in self.cases:
+            with self.subTest(value=value, types=types, nullable=nullable):
+                self.assertIs(type_ok(value, types, nullable), expected)
+
+    def test_python(self):
+        self.check(_py_type_ok)
+
+    def test_selected(self):
+        self.check(_type_ok)
+
+    @unittest.skipIf(_c_type_ok is None, "drastic._drastic_fast is not built")
+    def test_c_matches_python(self):
+        self.check(_c_type_ok)
+        for value, types, nullable, _ in self.cases:
+            self.assertIs(_c_type_ok(value, types, nullable), _py_type_ok(value, types, nullable))
+
+
+class StackedDecoratorsTest(unittest.TestCase):
+    """ Tests combining @init and @strict. """
+
+    def test_init_over_strict(self):
+        class Point:
+            @init
+            @strict
+            def __init__(self, a: int):
+                pass
+
+        self.assertEqual(Point(1).a, 1)
+        self.assertEqual(Point(2).a, 2)
+        self.assertRaises(ArgumentTypeError, Point, 'x')
+
+
+
+class WrappingTest(unittest.TestCase):
+    """ Tests of the wrappers returned by @strict and @init. """
+
+    def test_strict_twice(self):
+        def f(x: int):
+            return x
+
+        checked = strict(f)
+        self.assertIs(strict(checked), checked)
+
+    def test_init_twice(self):
+        def constructor(self, x: int):
+            pass
+
+        initializer = init(constructor)
+        self.assertIs(init(initializer), initializer)
+
+    def test_copied_marker_is_wrapped_again(self):
+        def f(x: int):
+            return x
+
+        checked = strict(f)
+
+        @functools.wraps(checked)
+        def outer(*args):
+            return checked(*args)
+
+        self.assertIsNot(strict(outer), outer)
+
+        initializer = init(lambda self, x: None)
+
+        @functools.wraps(initializer)
+        def outer_init(*args):
+            return initializer(*args)
+
+        self.assertIsNot(init(outer_init), outer_init)
+
+    def test_metadata_preserved(self):
+        class K:
+            @strict
+            def m(self, x: int) -> int:
+                """ Returns x. """
+                return x
+
+            @init
+            def __init__(self, y: str='y'):
+                """ Initializes K. """
+
+        def f(a: int, b: (str, 'nonable')=None) -> int:
+            return a
+
+        self.assertEqual(K.m.__name__, 'm')
+        self.assertEqual(K.m.__doc__, ' Returns x. ')
+        self.assertEqual(K.__init__.__name__, '__init__')
+        self.assertEqual(K.__init__.__doc__, ' Initializes K. ')
+        self.assertEqual(inspect.signature(strict(f)), inspect.signature(f))
+        self.assertEqual(inspect.signature(K.__init__), inspect.signature(K.__init__.__wrapped__))
+
+
+if __name__ == '__main__':
+    unittest.main()